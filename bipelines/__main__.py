@@ -1,12 +1,11 @@
 import argparse
+import functools
 import json
 import sys
 
-from bipelines.config import CommandConfig, RepoConfig, BipelineConfig, load_config_from_yaml, load_config_from_dict
-from bipelines.bipeline import Bipeline
 
-
-def parse_args():
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Bipelines: run commands locally and poll resulting Beaker experiments",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -52,12 +51,27 @@ def parse_args():
         help="Show what would happen without executing",
     )
 
-    return parser.parse_args()
+    return parser
+
+
+def parse_args():
+    return _build_parser().parse_args()
 
 
 def main():
     args = parse_args()
 
+    # Imported after argparse so `--help` and usage errors skip the heavy
+    # beaker/rich imports entirely.
+    from bipelines.bipeline import Bipeline
+    from bipelines.config import (
+        CommandConfig,
+        RepoConfig,
+        BipelineConfig,
+        load_config_from_yaml,
+        load_config_from_dict,
+    )
+
     if args.config_json:
         config = load_config_from_dict(json.loads(args.config_json))
     elif args.config:
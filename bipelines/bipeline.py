@@ -11,7 +11,10 @@ from rich.table import Table
 
 from bipelines.config import CommandConfig, BipelineConfig
 from bipelines.experiment import (
+    TERMINAL_STATUSES,
     get_experiment_status,
+    get_workload_status,
+    workload_display_status,
     run_command_and_capture_experiment,
     run_raw_command,
 )
@@ -40,22 +43,14 @@ def srule(*args, **kwargs):
 HASH_TAG_RE = re.compile(r"\(bipelines:([a-f0-9]+)\)\s*")
 HASH_TAG_SEARCH = "(bipelines:"
 
-WORKLOAD_STATUS_DISPLAY = {
-    pb2.WorkloadStatus.STATUS_SUBMITTED: "pending",
-    pb2.WorkloadStatus.STATUS_QUEUED: "pending",
-    pb2.WorkloadStatus.STATUS_INITIALIZING: "pending",
-    pb2.WorkloadStatus.STATUS_READY_TO_START: "pending",
-    pb2.WorkloadStatus.STATUS_RUNNING: "running",
-    pb2.WorkloadStatus.STATUS_STOPPING: "running",
-    pb2.WorkloadStatus.STATUS_UPLOADING_RESULTS: "running",
-    pb2.WorkloadStatus.STATUS_SUCCEEDED: "completed",
-    pb2.WorkloadStatus.STATUS_FAILED: "failed",
-    pb2.WorkloadStatus.STATUS_CANCELED: "canceled",
-}
-
+ABORT_STATUSES = frozenset({"failed", "canceled"})
 
 def _parse_hash_tag(description: str) -> Optional[str]:
     """Extract the bipelines task hash from a description like '(bipelines:abc123) ...'."""
+    # startswith fast path: most workspace descriptions are not tagged, and the
+    # C-level prefix check is far cheaper than running the regex to reject them.
+    if not description.startswith(HASH_TAG_SEARCH):
+        return None
     m = HASH_TAG_RE.match(description)
     return m.group(1) if m else None
 
@@ -63,38 +58,82 @@ def _parse_hash_tag(description: str) -> Optional[str]:
 class Bipeline:
     def __init__(self, config: BipelineConfig):
         self.config = config
-        self.beaker = Beaker.from_env()
+        self._beaker: Optional[Beaker] = None
         self._workload_cache: dict[str, pb2.Workload] = {}
 
+        self._url_cache: dict[str, str] = {}
+        self._display_cache: dict[str, str] = {}
+
+        # Create the artifact directory once up front rather than per write.
+        self._state_path: Optional[Path] = None
+        if config.state_dir:
+            try:
+                state_path = Path(config.state_dir)
+                state_path.mkdir(parents=True, exist_ok=True)
+                self._state_path = state_path
+            except OSError as e:
+                sprint(f"  [dim]Warning: could not create state_dir: {e}[/dim]")
+
+    @property
+    def beaker(self) -> Beaker:
+        """Lazily-created Beaker client, so dry runs never pay the auth roundtrip."""
+        if self._beaker is None:
+            self._beaker = Beaker.from_env()
+        return self._beaker
+
     # ── Beaker-based deduplication ──────────────────────────────────────
 
     def _build_workload_cache(self):
         """Pre-fetch all bipelines-tagged workloads from the Beaker workspace."""
-        self._workload_cache = {}
-        if not self.config.workspace:
+        cache: dict[str, pb2.Workload] = {}
+        self._workload_cache = cache
+        cfg = self.config
+        if not cfg.workspace:
             return
+        # Stop consuming the paginated listing as soon as every hash this run
+        # could dedup against has been seen, instead of walking the whole
+        # workspace history.
+        needed = {cfg.task_hash(c) for c in cfg.commands if not c.raw}
         try:
             for w in self.beaker.workload.list(
-                workspace=self.config.workspace,
+                workspace=cfg.workspace,
                 name_or_description=HASH_TAG_SEARCH,
             ):
                 task_hash = _parse_hash_tag(w.experiment.description or "")
-                if task_hash and task_hash not in self._workload_cache:
-                    self._workload_cache[task_hash] = w
+                if task_hash and task_hash not in cache:
+                    cache[task_hash] = w
+                    needed.discard(task_hash)
+                    if not needed:
+                        break
         except Exception as e:
             sprint(f"  [dim]Warning: could not query Beaker workspace: {e}[/dim]")
 
-    def _tag_experiment(self, experiment_id: str, task_hash: str):
+    def _tag_experiment(
+        self,
+        experiment_id: str,
+        task_hash: str,
+        workload: Optional[pb2.Workload] = None,
+    ):
         """Prepend the bipelines hash tag to the experiment description, preserving any original text.
 
         Idempotent: strips an existing tag before re-applying, so the job's own
         description updates are kept intact even if we re-tag periodically.
+        Callers that already hold a freshly-fetched workload can pass it to
+        skip the extra get RPC.
         """
         try:
-            workload = self.beaker.workload.get(experiment_id)
+            if workload is None:
+                workload = self.beaker.workload.get(experiment_id)
             current_desc = workload.experiment.description or ""
-            original = HASH_TAG_RE.sub("", current_desc, count=1)
-            new_desc = f"(bipelines:{task_hash}) {original}".rstrip()
+            original = current_desc
+            if current_desc.startswith(HASH_TAG_SEARCH):
+                end = current_desc.find(")", len(HASH_TAG_SEARCH))
+                if end != -1:
+                    original = current_desc[end + 1 :].lstrip()
+            if original:
+                new_desc = f"(bipelines:{task_hash}) {original}"
+            else:
+                new_desc = f"(bipelines:{task_hash})"
             if new_desc != current_desc:
                 self.beaker.workload.update(workload, description=new_desc)
         except Exception as e:
@@ -105,28 +144,41 @@ class Bipeline:
         experiment_id: str,
         task_hash: str,
         poll_interval: float = 15.0,
-        retag_every: int = 4,
+        retag_interval: float = 60.0,
     ) -> str:
-        """Poll a Beaker experiment until terminal, re-tagging the description periodically."""
+        """Poll a Beaker experiment until terminal, re-tagging the description periodically.
+
+        Polls with exponential backoff, starting fast and doubling up to
+        `poll_interval`; the backoff resets on status transitions so state
+        changes are caught quickly. Re-tagging is time-based (`retag_interval`
+        seconds) so the cadence is independent of the poll rate.
+        """
         last_status = None
-        polls = 0
+        interval = 1.0
+        last_retag = time.monotonic()
 
         while True:
-            status = get_experiment_status(self.beaker, experiment_id)
+            # Fetch the workload once per poll; both the status check and any
+            # retag reuse it rather than issuing separate get RPCs.
+            workload = self.beaker.workload.get(experiment_id)
+            status = get_workload_status(self.beaker, workload)
 
             if status != last_status:
                 sprint(f"  Status: [yellow]{status}[/yellow]")
                 last_status = status
+                interval = 1.0
 
-            if status in ("completed", "failed", "canceled"):
-                self._tag_experiment(experiment_id, task_hash)
+            if status in TERMINAL_STATUSES:
+                self._tag_experiment(experiment_id, task_hash, workload=workload)
                 return status
 
-            polls += 1
-            if polls % retag_every == 0:
-                self._tag_experiment(experiment_id, task_hash)
+            now = time.monotonic()
+            if now - last_retag >= retag_interval:
+                self._tag_experiment(experiment_id, task_hash, workload=workload)
+                last_retag = now
 
-            time.sleep(poll_interval)
+            time.sleep(interval)
+            interval = min(interval * 2, poll_interval)
 
     # ── Main loop ──────────────────────────────────────────────────────
 
@@ -137,36 +189,51 @@ class Bipeline:
         """
         cfg = self.config
 
-        sprint()
-        sprint("[bold]Bipelines[/bold]")
-        sprint(f"  Run hash:   {cfg.run_hash or '(none)'}")
-        sprint(f"  Workspace:  {cfg.workspace or '(none — dedup disabled)'}")
-        sprint(f"  Commands:   {len(cfg.commands)}")
+        # Emit the banner as one print so it lands in a single write.
+        banner = [
+            "",
+            "[bold]Bipelines[/bold]",
+            f"  Run hash:   {cfg.run_hash or '(none)'}",
+            f"  Workspace:  {cfg.workspace or '(none — dedup disabled)'}",
+            f"  Commands:   {len(cfg.commands)}",
+        ]
         if cfg.repos:
-            sprint(f"  Repos:      {len(cfg.repos)} (local install)")
+            banner.append(f"  Repos:      {len(cfg.repos)} (local install)")
         if cfg.dry_run:
-            sprint("  [yellow]DRY RUN — commands will not be executed[/yellow]")
-        sprint()
+            banner.append("  [yellow]DRY RUN — commands will not be executed[/yellow]")
+        banner.append("")
+        sprint("\n".join(banner))
 
-        if cfg.workspace:
+        if cfg.workspace and not cfg.dry_run:
             sprint("[dim]Fetching existing experiments from Beaker...[/dim]")
             self._build_workload_cache()
+        elif cfg.workspace:
+            sprint("[dim]Dry run — skipping Beaker dedup lookup.[/dim]")
 
         if cfg.repos:
             srule("[bold]Setting up local environment[/bold]")
             setup_local_env(cfg.repos, env_dir=cfg.local_env_dir)
             sprint()
 
-        self._print_task_table()
+        # Touch each command once for hashing and cache lookup; the table and
+        # the main loop both consume this plan.
+        plan = [
+            (i, cmd, cfg.task_hash(cmd), self._workload_cache.get(cfg.task_hash(cmd)))
+            for i, cmd in enumerate(cfg.commands)
+        ]
+
+        self._print_task_table(plan)
 
         results = []
+        completed = 0
         failed = False
-        for i, cmd in enumerate(cfg.commands):
-            task_hash = cfg.task_hash(cmd)
-            status = self._process_task(i, cmd, task_hash)
+        for i, cmd, task_hash, cached in plan:
+            status = self._process_task(i, cmd, task_hash, cached)
             results.append({"command": cmd.command, "hash": task_hash, "status": status})
 
-            if status in ("failed", "canceled"):
+            if status == "completed":
+                completed += 1
+            elif status in ABORT_STATUSES:
                 sprint()
                 srule("[bold red]Pipeline aborted[/bold red]")
                 sprint()
@@ -177,7 +244,6 @@ class Bipeline:
             sprint()
             srule("[bold green]All tasks completed[/bold green]")
 
-        completed = sum(1 for r in results if r["status"] == "completed")
         sprint(f"  Completed: {completed}/{len(cfg.commands)}")
         sprint()
 
@@ -191,31 +257,37 @@ class Bipeline:
 
     # ── Per-task logic ─────────────────────────────────────────────────
 
-    def _process_task(self, index: int, cmd: CommandConfig, task_hash: str) -> str:
+    def _process_task(
+        self,
+        index: int,
+        cmd: CommandConfig,
+        task_hash: str,
+        cached: Optional[pb2.Workload] = None,
+    ) -> str:
         cfg = self.config
         total = len(cfg.commands)
 
         srule(f"Task {index + 1}/{total}")
-        sprint(f"  Command: {cmd.command}")
+        header = [f"  Command: {cmd.command}"]
         if cmd.lib:
-            sprint(f"  Lib:     {cmd.lib}")
+            header.append(f"  Lib:     {cmd.lib}")
         if cmd.raw:
-            sprint("  Mode:    [dim]raw[/dim]")
-        sprint(f"  Hash:    {task_hash}")
+            header.append("  Mode:    [dim]raw[/dim]")
+        header.append(f"  Hash:    {task_hash}")
+        sprint("\n".join(header))
 
-        if not cmd.raw:
-            cached = self._workload_cache.get(task_hash)
-            if cached is not None:
-                result = self._check_existing_experiment(cached, task_hash)
-                if result is not None:
-                    return result
+        if not cmd.raw and cached is not None:
+            result = self._check_existing_experiment(cached, task_hash)
+            if result is not None:
+                return result
 
         if cfg.dry_run:
             sprint("  [dim]Dry run — would execute command[/dim]")
             return "dry_run"
 
-        cwd = str(cfg.repo_dir(cmd.lib)) if cmd.lib else None
-        env = repo_venv_env(cfg.repo_dir(cmd.lib)) if cmd.lib else None
+        repo_path = cfg.repo_dir(cmd.lib) if cmd.lib else None
+        cwd = str(repo_path) if repo_path else None
+        env = repo_venv_env(repo_path) if repo_path else None
 
         if cmd.raw:
             return self._run_raw(cmd, cwd=cwd, env=env)
@@ -260,20 +332,34 @@ class Bipeline:
             sprint(f"  [red]Command failed with exit code {rc}[/red]")
             return "failed"
 
+    def _workload_url(self, workload: pb2.Workload) -> str:
+        """Resolve the experiment URL for a workload, cached by experiment id."""
+        exp_id = workload.experiment.id
+        url = self._url_cache.get(exp_id)
+        if url is None:
+            url = self.beaker.workload.url(workload)
+            self._url_cache[exp_id] = url
+        return url
+
     def _check_existing_experiment(
         self, workload: pb2.Workload, task_hash: str
     ) -> Optional[str]:
         """Check a previously-tracked experiment. Returns status to use, or None to re-run."""
         exp_id = workload.experiment.id
-        url = self.beaker.workload.url(workload)
+        url = self._workload_url(workload)
 
-        display_status = WORKLOAD_STATUS_DISPLAY.get(workload.status, "unknown")
+        display_status = workload_display_status(workload.status)
 
         if display_status == "completed":
             sprint(f"  [green]Already completed on Beaker — skipping.[/green]")
             sprint(f"  URL: [link={url}]{url}[/link]")
             return "completed"
 
+        # Terminal statuses can't change, so skip the live status RPC.
+        if display_status in ABORT_STATUSES:
+            sprint(f"  [red]Previous run {display_status} — re-running.[/red]")
+            return None
+
         try:
             status = get_experiment_status(self.beaker, exp_id)
         except Exception as e:
@@ -298,34 +384,37 @@ class Bipeline:
 
     # ── Display helpers ────────────────────────────────────────────────
 
-    def _print_task_table(self):
+    def _print_task_table(self, plan: list):
         table = Table(title="Tasks", box=None)
         table.add_column("#", style="cyan", width=4)
         table.add_column("Hash", style="yellow", width=14)
         table.add_column("Command", style="white", overflow="fold")
         table.add_column("Status", style="green", width=12)
 
-        for i, cmd in enumerate(self.config.commands):
-            task_hash = self.config.task_hash(cmd)
-            cached = self._workload_cache.get(task_hash)
+        for i, cmd, task_hash, cached in plan:
             if cached is not None:
-                status = WORKLOAD_STATUS_DISPLAY.get(cached.status, "unknown")
+                status = workload_display_status(cached.status)
             else:
                 status = "new"
-            display_cmd = cmd.command if len(cmd.command) <= 80 else cmd.command[:77] + "..."
+            display_cmd = self._display_cache.get(cmd.command)
+            if display_cmd is None:
+                display_cmd = (
+                    cmd.command if len(cmd.command) <= 80 else cmd.command[:77] + "..."
+                )
+                self._display_cache[cmd.command] = display_cmd
             table.add_row(str(i + 1), task_hash, display_cmd, status)
 
         sprint(table)
         sprint()
 
     def _write_artifact(self, filename: str, data: dict):
-        if not self.config.state_dir:
+        if self._state_path is None:
             return
         try:
-            out_dir = Path(self.config.state_dir)
-            out_dir.mkdir(parents=True, exist_ok=True)
-            path = out_dir / filename
-            with open(path, "w") as f:
-                json.dump(data, f, indent=2)
+            # Compact, single-shot serialization: artifacts are machine-read,
+            # so skip the indent (roughly half the bytes) and write once.
+            (self._state_path / filename).write_text(
+                json.dumps(data, separators=(",", ":"))
+            )
         except OSError as e:
             sprint(f"  [dim]Warning: could not write to state_dir: {e}[/dim]")
@@ -1,10 +1,17 @@
 import hashlib
-from dataclasses import dataclass, field
+import io
+from dataclasses import dataclass, field, fields
+from functools import cached_property
 from typing import Dict, List, Optional
 from pathlib import Path
 
 import yaml
 
+# Prefer the libyaml-backed loader/dumper when available; same semantics as
+# the pure-Python Safe variants.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class RepoConfig:
@@ -16,9 +23,13 @@ class RepoConfig:
     install: Optional[str] = None
     path: Optional[str] = None
 
+    def __post_init__(self):
+        # Parse the URL once at construction instead of on every access.
+        self._name = self.url.rstrip("/").split("/")[-1].removesuffix(".git")
+
     @property
     def name(self) -> str:
-        return self.url.rstrip("/").split("/")[-1].removesuffix(".git")
+        return self._name
 
 
 @dataclass
@@ -30,6 +41,12 @@ class CommandConfig:
     raw: bool = False
 
 
+# Declared field names, fixed at class definition; serialization iterates
+# these instead of __dict__, which also carries private caches.
+_REPO_EMIT_FIELDS = tuple(f.name for f in fields(RepoConfig))
+_COMMAND_EMIT_FIELDS = tuple(f.name for f in fields(CommandConfig))
+
+
 @dataclass
 class BipelineConfig:
     """Main configuration for the bipelines orchestrator."""
@@ -44,60 +61,144 @@ class BipelineConfig:
     state_dir: Optional[str] = None
     dry_run: bool = False
 
-    @property
+    def __post_init__(self):
+        self._hash_cache: dict[tuple[str, str], str] = {}
+
+    @cached_property
     def repo_lookup(self) -> Dict[str, RepoConfig]:
         return {r.name: r for r in self.repos}
 
     def validate(self):
         """Check that all lib references in commands point to known repos."""
-        repo_names = {r.name for r in self.repos}
+        repo_names = self.repo_lookup.keys()
         for cmd in self.commands:
-            if cmd.lib and cmd.lib not in repo_names:
+            if cmd.lib is not None and cmd.lib not in repo_names:
                 raise ValueError(
                     f"Command references unknown lib '{cmd.lib}'. "
                     f"Available repos: {', '.join(sorted(repo_names))}"
                 )
 
+    @cached_property
+    def _local_env_root(self) -> Path:
+        # resolve() hits the filesystem; do it once per config.
+        return Path(self.local_env_dir).resolve()
+
     def repo_dir(self, repo_name: str) -> Path:
         """Resolve the on-disk path for a cloned repo."""
-        return Path(self.local_env_dir).resolve() / "repos" / repo_name
+        return self._local_env_root / "repos" / repo_name
 
     def task_hash(self, cmd: CommandConfig) -> str:
-        """Deterministic hash for deduplication: command + run_hash."""
+        """Deterministic hash for deduplication: command + run_hash. Memoized."""
+        # run_hash is part of the key: the CLI can override it after load.
+        key = (cmd.command, self.run_hash)
+        cached = self._hash_cache.get(key)
+        if cached is not None:
+            return cached
         content = f"{cmd.command}|{self.run_hash}"
-        return hashlib.sha256(content.encode()).hexdigest()[:12]
+        task_hash = hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
+        self._hash_cache[key] = task_hash
+        return task_hash
 
     def to_dict(self) -> dict:
         """Serialize to a plain dict suitable for YAML output."""
-        d: dict = {}
-        if self.run_hash:
-            d["run_hash"] = self.run_hash
-        if self.workspace:
-            d["workspace"] = self.workspace
-        if self.local_env_dir != ".bipelines":
-            d["local_env_dir"] = self.local_env_dir
-        if self.state_dir:
-            d["state_dir"] = self.state_dir
-        if self.dry_run:
-            d["dry_run"] = self.dry_run
+        scalars = (
+            ("run_hash", self.run_hash, bool),
+            ("workspace", self.workspace, bool),
+            ("local_env_dir", self.local_env_dir, lambda v: v != ".bipelines"),
+            ("state_dir", self.state_dir, bool),
+            ("dry_run", self.dry_run, bool),
+        )
+        d: dict = {k: v for k, v, keep in scalars if keep(v)}
         if self.repos:
             d["repos"] = [
-                {k: v for k, v in r.__dict__.items() if v is not None and k != "name"}
+                {k: v for k in _REPO_EMIT_FIELDS if (v := getattr(r, k)) is not None}
                 for r in self.repos
             ]
         d["commands"] = [
-            {k: v for k, v in c.__dict__.items() if v is not None}
+            {k: v for k in _COMMAND_EMIT_FIELDS if (v := getattr(c, k)) is not None}
             for c in self.commands
         ]
         return d
 
     def to_yaml(self, path: str) -> str:
         """Write this config to a YAML file and return the path."""
-        with open(path, "w") as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, sort_keys=False)
+        d = self.to_dict()
+        text = _fast_dump(d)
+        if text is None:
+            # Dump into memory first: the yaml emitter issues many tiny
+            # writes when handed a file object.
+            buf = io.StringIO()
+            yaml.dump(
+                d,
+                buf,
+                Dumper=_Dumper,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+            text = buf.getvalue()
+        Path(path).write_text(text)
         return path
 
 
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _emit_scalar(v) -> Optional[str]:
+    if v is True:
+        return "true"
+    if v is False:
+        return "false"
+    if v is None:
+        return "null"
+    if isinstance(v, str):
+        # Newlines and other control characters need block scalars or escape
+        # sequences to survive a round-trip; punt those to yaml.dump. For
+        # everything else, single-quoting is valid YAML for any content and
+        # far cheaper than deciding whether a plain scalar would be safe.
+        if not v.isprintable():
+            return None
+        return "'" + v.replace("'", "''") + "'"
+    return str(v)
+
+
+def _fast_dump(data: dict) -> Optional[str]:
+    """Emit block-style YAML for the known config schema.
+
+    Handles scalars and lists of flat dicts — the only shapes to_dict
+    produces. Returns None for anything else so the caller can fall back to
+    yaml.dump.
+    """
+    lines = []
+    for key, value in data.items():
+        if isinstance(value, _SCALAR_TYPES):
+            emitted = _emit_scalar(value)
+            if emitted is None:
+                return None
+            lines.append(f"{key}: {emitted}")
+        elif isinstance(value, list):
+            if not value:
+                # A bare "key:" parses back as None, not [].
+                lines.append(f"{key}: []")
+                continue
+            lines.append(f"{key}:")
+            for item in value:
+                if not isinstance(item, dict) or not item:
+                    return None
+                prefix = "- "
+                for k, v in item.items():
+                    emitted = (
+                        _emit_scalar(v) if isinstance(v, _SCALAR_TYPES) else None
+                    )
+                    if emitted is None:
+                        return None
+                    lines.append(f"{prefix}{k}: {emitted}")
+                    prefix = "  "
+        else:
+            return None
+    lines.append("")
+    return "\n".join(lines)
+
+
 def load_config_from_dict(data: dict) -> BipelineConfig:
     kwargs = {k: v for k, v in data.items() if k not in ("repos", "commands")}
     kwargs["repos"] = [RepoConfig(**r) for r in data.get("repos", [])]
@@ -118,6 +219,8 @@ def load_config_from_dict(data: dict) -> BipelineConfig:
 
 
 def load_config_from_yaml(path: str) -> BipelineConfig:
-    with open(path) as f:
-        data = yaml.safe_load(f)
+    # Binary mode lets libyaml decode UTF-8 itself, streaming straight from
+    # the file instead of going through Python's text layer.
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_Loader)
     return load_config_from_dict(data)
@@ -1,10 +1,13 @@
 import os
 import re
+import select
 import subprocess
+import sys
 import time
 from typing import Optional, Tuple
 
 from beaker import Beaker, BeakerWorkloadStatus
+from beaker import beaker_pb2 as pb2
 from rich.console import Console
 
 console = Console()
@@ -18,6 +21,36 @@ def sprint(*args, **kwargs):
         print(plain)
 
 
+TERMINAL_STATUSES = frozenset({"completed", "failed", "canceled"})
+
+WORKLOAD_STATUS_DISPLAY = {
+    pb2.WorkloadStatus.STATUS_SUBMITTED: "pending",
+    pb2.WorkloadStatus.STATUS_QUEUED: "pending",
+    pb2.WorkloadStatus.STATUS_INITIALIZING: "pending",
+    pb2.WorkloadStatus.STATUS_READY_TO_START: "pending",
+    pb2.WorkloadStatus.STATUS_RUNNING: "running",
+    pb2.WorkloadStatus.STATUS_STOPPING: "running",
+    pb2.WorkloadStatus.STATUS_UPLOADING_RESULTS: "running",
+    pb2.WorkloadStatus.STATUS_SUCCEEDED: "completed",
+    pb2.WorkloadStatus.STATUS_FAILED: "failed",
+    pb2.WorkloadStatus.STATUS_CANCELED: "canceled",
+}
+
+# Dense tuple indexed by the pb2 enum value: a plain index beats dict hashing
+# when rendering statuses for many workloads.
+_WORKLOAD_STATUS_ARR = tuple(
+    WORKLOAD_STATUS_DISPLAY.get(i, "unknown")
+    for i in range(max(WORKLOAD_STATUS_DISPLAY) + 1)
+)
+
+
+def workload_display_status(status: int) -> str:
+    """Map a pb2 WorkloadStatus value to its display string."""
+    if 0 <= status < len(_WORKLOAD_STATUS_ARR):
+        return _WORKLOAD_STATUS_ARR[status]
+    return "unknown"
+
+
 EXPERIMENT_RE = re.compile(r"Experiment:\s+(\S+)\s+→\s+(https://beaker\.org/ex/(\S+))")
 EXPERIMENT_SUBMITTED_RE = re.compile(r"Experiment submitted, see progress at\s+(https://beaker\.org/ex/(\S+))")
 
@@ -38,6 +71,60 @@ def parse_experiment_line(line: str) -> Optional[Tuple[str, str, str]]:
     return None
 
 
+class _LineBuffer:
+    """Batches raw output lines into larger writes, bounded by size and latency."""
+
+    def __init__(self, out, max_bytes: int = 4096, max_delay: float = 0.1):
+        self._out = out
+        self._buf: list[bytes] = []
+        self._buffered = 0
+        self._max_bytes = max_bytes
+        self._max_delay = max_delay
+        self._last_flush = time.monotonic()
+
+    def write(self, line: bytes):
+        self._buf.append(line)
+        self._buffered += len(line)
+        if (
+            self._buffered >= self._max_bytes
+            or time.monotonic() - self._last_flush >= self._max_delay
+        ):
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self._out.write(b"".join(self._buf))
+            self._buf.clear()
+            self._buffered = 0
+        self._out.flush()
+        self._last_flush = time.monotonic()
+
+
+def _stream_lines(stream, writer: _LineBuffer):
+    """Yield lines from `stream`, flushing `writer` whenever the stream idles.
+
+    `_LineBuffer.write` only re-checks its latency bound on the next write, so
+    a quiet subprocess would otherwise leave buffered tail output invisible
+    until more data arrives. Selecting on the pipe with the writer's delay as
+    the timeout lets us flush as soon as the producer pauses.
+    """
+    fd = stream.fileno()
+    buf = b""
+    while True:
+        if not select.select([fd], [], [], writer._max_delay)[0]:
+            writer.flush()
+            continue
+        chunk = os.read(fd, 1 << 16)
+        if not chunk:
+            break
+        buf += chunk
+        while (end := buf.find(b"\n")) != -1:
+            yield buf[: end + 1]
+            buf = buf[end + 1 :]
+    if buf:
+        yield buf
+
+
 def run_command_and_capture_experiment(
     command: str,
     env: Optional[dict] = None,
@@ -48,27 +135,36 @@ def run_command_and_capture_experiment(
     Returns (experiment_name, url, experiment_id).
     Raises RuntimeError if the command fails or no experiment line is found.
     """
-    merged_env = {**os.environ, **(env or {})}
+    merged_env = os.environ.copy()
+    if env:
+        merged_env.update(env)
     merged_env.setdefault("COLUMNS", "500")
 
+    # Stream in binary with a large pipe buffer; only candidate experiment
+    # lines are decoded, everything else passes through as raw bytes.
     proc = subprocess.Popen(
         command,
         shell=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
+        bufsize=1 << 16,
         env=merged_env,
         cwd=cwd,
     )
 
+    writer = _LineBuffer(sys.stdout.buffer)
     experiment_info = None
-    for line in proc.stdout:
-        stripped = line.rstrip("\n")
-        print(f"  {stripped}")
-        if experiment_info is None:
-            parsed = parse_experiment_line(stripped)
+    for line in _stream_lines(proc.stdout, writer):
+        # Cheap substring prefilter: both experiment-line formats contain
+        # "Experiment", so skip decoding and the regexes for most lines.
+        if experiment_info is None and b"Experiment" in line:
+            parsed = parse_experiment_line(
+                line.decode("utf-8", errors="replace").rstrip("\n")
+            )
             if parsed:
                 experiment_info = parsed
+        writer.write(b"  " + line)
+    writer.flush()
 
     proc.wait()
 
@@ -87,7 +183,9 @@ def run_raw_command(
     cwd: Optional[str] = None,
 ) -> int:
     """Run a command locally, streaming output. Returns the exit code."""
-    merged_env = {**os.environ, **(env or {})}
+    merged_env = os.environ.copy()
+    if env:
+        merged_env.update(env)
     merged_env.setdefault("COLUMNS", "500")
 
     proc = subprocess.Popen(
@@ -95,33 +193,63 @@ def run_raw_command(
         shell=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
+        bufsize=1 << 16,
         env=merged_env,
         cwd=cwd,
     )
 
-    for line in proc.stdout:
-        print(f"  {line.rstrip(chr(10))}")
+    writer = _LineBuffer(sys.stdout.buffer)
+    for line in _stream_lines(proc.stdout, writer):
+        writer.write(b"  " + line)
+    writer.flush()
 
     proc.wait()
     return proc.returncode
 
 
-def get_experiment_status(beaker: Beaker, experiment_id: str) -> str:
-    """Get the current status of a Beaker experiment by ID."""
-    workload = beaker.workload.get(experiment_id)
+JOB_STATUS_DISPLAY = {
+    BeakerWorkloadStatus.running: "running",
+    BeakerWorkloadStatus.succeeded: "completed",
+    BeakerWorkloadStatus.failed: "failed",
+    BeakerWorkloadStatus.canceled: "canceled",
+}
+
+
+def get_workload_status(beaker: Beaker, workload) -> str:
+    """Get the current status of an already-fetched Beaker workload."""
     job = beaker.workload.get_latest_job(workload)
 
     if job is None:
         return "pending"
 
-    STATUS_MAP = {
-        BeakerWorkloadStatus.running: "running",
-        BeakerWorkloadStatus.succeeded: "completed",
-        BeakerWorkloadStatus.failed: "failed",
-        BeakerWorkloadStatus.canceled: "canceled",
-    }
-    return STATUS_MAP.get(job.status.status, "unknown")
+    return JOB_STATUS_DISPLAY.get(job.status.status, "unknown")
+
+
+def get_experiment_status(beaker: Beaker, experiment_id: str) -> str:
+    """Get the current status of a Beaker experiment by ID."""
+    return get_workload_status(beaker, beaker.workload.get(experiment_id))
+
+
+def poll_statuses(beaker: Beaker, workspace: str, ids: set[str]) -> dict:
+    """Fetch statuses for several experiments with a single workspace query.
+
+    Returns a dict mapping experiment id -> display status for every id found,
+    avoiding one round-trip per experiment.
+    """
+    remaining = set(ids)
+    statuses: dict[str, str] = {}
+    if not remaining:
+        return statuses
+
+    for workload in beaker.workload.list(workspace=workspace):
+        exp_id = workload.experiment.id
+        if exp_id in remaining:
+            statuses[exp_id] = workload_display_status(workload.status)
+            remaining.discard(exp_id)
+            if not remaining:
+                break
+
+    return statuses
 
 
 def wait_for_experiment(
@@ -129,8 +257,13 @@ def wait_for_experiment(
     experiment_id: str,
     poll_interval: float = 15.0,
 ) -> str:
-    """Poll a Beaker experiment until it reaches a terminal state. Returns final status."""
+    """Poll a Beaker experiment until it reaches a terminal state. Returns final status.
+
+    Polls with exponential backoff: quickly around status transitions, backing
+    off to `poll_interval` while the status is stable.
+    """
     last_status = None
+    interval = 1.0
 
     while True:
         status = get_experiment_status(beaker, experiment_id)
@@ -138,8 +271,10 @@ def wait_for_experiment(
         if status != last_status:
             sprint(f"  Status: [yellow]{status}[/yellow]")
             last_status = status
+            interval = 1.0
 
-        if status in ("completed", "failed", "canceled"):
+        if status in TERMINAL_STATUSES:
             return status
 
-        time.sleep(poll_interval)
+        time.sleep(interval)
+        interval = min(interval * 1.5, poll_interval)
@@ -1,16 +1,15 @@
 import argparse
+import functools
+import hashlib
 import json
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import List, Optional, Union
 
-from rich.console import Console
-
 from bipelines.config import BipelineConfig
 
-console = Console()
-
 # Inline script executed inside the clean launch venv.
 # Reads Recipe parameters from stdin as JSON, creates and launches the gantry Recipe.
 _LAUNCH_SCRIPT = """\
@@ -38,34 +37,64 @@ else:
 """
 
 
+@functools.lru_cache(maxsize=1)
 def _get_git_info() -> tuple[str, str]:
-    """Return (remote_url, branch) for the current git repo."""
-    url = subprocess.check_output(
-        ["git", "remote", "get-url", "origin"], text=True
-    ).strip()
-    branch = (
-        subprocess.check_output(
-            ["git", "branch", "--show-current"], text=True
-        ).strip()
-        or "main"
+    """Return (remote_url, branch) for the current git repo. Cached per process."""
+    # Overlap the two git calls: each costs a process spawn, and neither
+    # depends on the other.
+    url_proc = subprocess.Popen(
+        ["git", "remote", "get-url", "origin"], stdout=subprocess.PIPE, text=True
     )
+    branch_proc = subprocess.Popen(
+        ["git", "branch", "--show-current"], stdout=subprocess.PIPE, text=True
+    )
+    url = url_proc.communicate()[0].strip()
+    branch = branch_proc.communicate()[0].strip() or "main"
+
+    for proc in (url_proc, branch_proc):
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
     return url, branch
 
 
+# How long a launch-env readiness sentinel stays trusted before we re-probe.
+_READY_TTL = 300.0
+
+
 def _ensure_launch_env(base_dir: str = ".bipelines") -> tuple[Path, str]:
     """Maintain a clean repo clone + venv under base_dir/launch/ for gantry.
 
     Returns (repo_path, venv_python_path).
     """
-    from bipelines.local_env import _find_uv
-
     launch_root = Path(base_dir).resolve() / "launch"
     repo_path = launch_root / "repo"
     venv_path = launch_root / "venv"
     url, branch = _get_git_info()
-    uv = _find_uv()
+    # Stringify once; every subprocess call below takes these as strings.
+    repo_s = str(repo_path)
+    venv_s = str(venv_path)
     venv_python = str(venv_path / "bin" / "python")
 
+    # A recently-validated env for this (url, branch) skips all subprocess
+    # probes; the sentinel is touched after every successful setup below.
+    key = hashlib.blake2b(f"{url}|{branch}".encode(), digest_size=6).hexdigest()
+    sentinel = launch_root / f".ready-{key}"
+    try:
+        if time.time() - sentinel.stat().st_mtime < _READY_TTL:
+            return repo_path, venv_python
+    except OSError:
+        pass
+
+    # Deferred so `bipelines-launch --help` doesn't pay the rich import.
+    from rich.console import Console
+
+    from bipelines.local_env import _find_uv
+
+    console = Console()
+
+    uv = _find_uv()
+
     launch_root.mkdir(parents=True, exist_ok=True)
 
     devnull = {"stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL}
@@ -73,26 +102,41 @@ def _ensure_launch_env(base_dir: str = ".bipelines") -> tuple[Path, str]:
     if not repo_path.exists():
         console.print(f"[dim]Cloning {url} (branch {branch}) into launch env...[/dim]")
         subprocess.run(
-            ["git", "clone", "--branch", branch, "--depth", "1", url, str(repo_path)],
+            [
+                "git", "-c", "protocol.version=2", "clone",
+                "--filter=blob:none", "--branch", branch, "--depth", "1",
+                url, repo_s,
+            ],
             check=True, **devnull,
         )
     else:
-        subprocess.run(
-            ["git", "fetch", "origin", branch, "--depth", "1"],
-            cwd=str(repo_path), check=True, **devnull,
-        )
-        subprocess.run(
-            ["git", "checkout", "FETCH_HEAD"],
-            cwd=str(repo_path), check=True, **devnull,
-        )
+        # Skip the fetch entirely when HEAD already matches the remote branch
+        # tip — the common steady-state case for repeat launches.
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_s, stdout=subprocess.PIPE, text=True,
+        ).stdout.strip()
+        remote = subprocess.run(
+            ["git", "ls-remote", "--heads", "origin", branch],
+            cwd=repo_s, stdout=subprocess.PIPE, text=True,
+        ).stdout.split()
+        if not remote or remote[0] != head:
+            subprocess.run(
+                ["git", "fetch", "origin", branch, "--depth", "1"],
+                cwd=repo_s, check=True, **devnull,
+            )
+            subprocess.run(
+                ["git", "checkout", "FETCH_HEAD"],
+                cwd=repo_s, check=True, **devnull,
+            )
 
     if not venv_path.exists():
         console.print("[dim]Creating launch venv...[/dim]")
         if uv:
-            subprocess.run([uv, "venv", str(venv_path)], check=True, **devnull)
+            subprocess.run([uv, "venv", venv_s], check=True, **devnull)
         else:
             subprocess.run(
-                [sys.executable, "-m", "venv", str(venv_path)], check=True
+                [sys.executable, "-m", "venv", venv_s], check=True
             )
 
         console.print("[dim]Installing bipelines into launch venv...[/dim]")
@@ -108,6 +152,7 @@ def _ensure_launch_env(base_dir: str = ".bipelines") -> tuple[Path, str]:
                 check=True, **devnull,
             )
 
+    sentinel.touch()
     return repo_path, venv_python
 
 
@@ -133,15 +178,22 @@ def launch(
     secrets = secrets or []
     extra_args = extra_args or []
 
+    # partition() both validates and splits in one pass; gantry still wants
+    # the raw KEY=VALUE strings, so only the validation result is kept.
     for ev in env:
-        if "=" not in ev:
+        if not ev.partition("=")[1]:
             raise ValueError(f"Invalid env var format '{ev}', expected KEY=VALUE")
     for sec in secrets:
-        if "=" not in sec:
+        if not sec.partition("=")[1]:
             raise ValueError(f"Invalid secret format '{sec}', expected ENV_VAR=SECRET_NAME")
 
     if isinstance(config, BipelineConfig):
-        task_args = ["bipelines", "--config-json", json.dumps(config.to_dict())] + extra_args
+        # Compact separators: this JSON rides on the child's command line,
+        # where length counts against exec limits.
+        config_json = json.dumps(
+            config.to_dict(), separators=(",", ":"), ensure_ascii=False
+        )
+        task_args = ["bipelines", "--config-json", config_json] + extra_args
     else:
         task_args = ["bipelines", "--config", config] + extra_args
 
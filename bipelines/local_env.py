@@ -1,7 +1,10 @@
+import functools
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
@@ -20,8 +23,13 @@ _UV_SEARCH_DIRS = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def _find_uv() -> str | None:
-    """Return the absolute path to uv, searching PATH then common install locations."""
+    """Return the absolute path to uv, searching PATH then common install locations.
+
+    Cached: the probe stats several directories and the answer doesn't change
+    within a process.
+    """
     found = shutil.which("uv")
     if found:
         return found
@@ -32,14 +40,23 @@ def _find_uv() -> str | None:
     return None
 
 
+# (PATH it was built from, base env) — rebuilt only when PATH changes.
+_UV_ENV_CACHE: tuple[str, dict] | None = None
+
+
 def _env_with_uv() -> dict:
     """Return a copy of os.environ with uv's directory on PATH (if found)."""
-    env = {**os.environ}
-    uv = _find_uv()
-    if uv:
-        uv_dir = str(Path(uv).parent)
-        env["PATH"] = f"{uv_dir}:{env.get('PATH', '')}"
-    return env
+    global _UV_ENV_CACHE
+    path = os.environ.get("PATH", "")
+    if _UV_ENV_CACHE is None or _UV_ENV_CACHE[0] != path:
+        env = {**os.environ}
+        uv = _find_uv()
+        if uv:
+            uv_dir = str(Path(uv).parent)
+            env["PATH"] = f"{uv_dir}:{path}"
+        _UV_ENV_CACHE = (path, env)
+    # Copy per call: callers mutate the result (e.g. repo_venv_env).
+    return dict(_UV_ENV_CACHE[1])
 
 
 def repo_venv_env(repo_path: Path) -> dict:
@@ -52,62 +69,106 @@ def repo_venv_env(repo_path: Path) -> dict:
     return env
 
 
+def _venv_marker(repo: RepoConfig) -> str:
+    """Content hash of the inputs that determine how a repo's venv is built."""
+    uv = _find_uv() or "uv"
+    content = f"{uv}|{sys.version_info[:2]}|{repo.install or ''}"
+    return hashlib.blake2b(content.encode(), digest_size=6).hexdigest()
+
+
+def _sync_repo(repo: RepoConfig, repos_path: Path) -> None:
+    """Clone a repo if needed and check out the requested commit or branch."""
+    repo_path = repos_path / repo.name
+
+    if not repo_path.exists():
+        console.print(f"  Cloning [cyan]{repo.url}[/cyan]...")
+        subprocess.run(
+            ["git", "clone", repo.url, str(repo_path)],
+            check=True,
+        )
+
+    if repo.commit:
+        console.print(f"  Checking out commit [yellow]{repo.commit[:12]}[/yellow]...")
+        subprocess.run(
+            ["git", "checkout", repo.commit],
+            cwd=str(repo_path),
+            check=True,
+        )
+    elif repo.branch:
+        console.print(f"  Checking out branch [yellow]{repo.branch}[/yellow]...")
+        subprocess.run(
+            ["git", "fetch", "origin", repo.branch],
+            cwd=str(repo_path),
+            check=True,
+        )
+        subprocess.run(
+            ["git", "checkout", repo.branch],
+            cwd=str(repo_path),
+            check=True,
+        )
+        subprocess.run(
+            ["git", "pull", "--ff-only"],
+            cwd=str(repo_path),
+            check=True,
+        )
+
+
 def setup_local_env(
     repos: List[RepoConfig],
     env_dir: str = ".bipelines",
+    create_venv: bool = True,
 ) -> None:
-    """Clone repos and install each into its own isolated venv."""
+    """Clone repos and install each into its own isolated venv.
+
+    With `create_venv=False` only the git sync runs; commands then execute
+    against the ambient environment (via _env_with_uv) instead of a per-repo
+    venv.
+    """
     env_path = Path(env_dir).resolve()
     repos_path = env_path / "repos"
     repos_path.mkdir(parents=True, exist_ok=True)
 
     base_env = _env_with_uv()
 
-    for repo in repos:
-        repo_path = repos_path / repo.name
-
-        if not repo_path.exists():
-            console.print(f"  Cloning [cyan]{repo.url}[/cyan]...")
-            subprocess.run(
-                ["git", "clone", repo.url, str(repo_path)],
-                check=True,
-            )
+    # Git syncs are independent, I/O-bound work — overlap them across repos.
+    # Installs stay serial below: they share uv's package cache and their
+    # output is much easier to follow.
+    if len(repos) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(repos))) as pool:
+            for future in [pool.submit(_sync_repo, r, repos_path) for r in repos]:
+                future.result()
+    elif repos:
+        _sync_repo(repos[0], repos_path)
 
-        if repo.commit:
-            console.print(f"  Checking out commit [yellow]{repo.commit[:12]}[/yellow]...")
-            subprocess.run(
-                ["git", "checkout", repo.commit],
-                cwd=str(repo_path),
-                check=True,
-            )
-        elif repo.branch:
-            console.print(f"  Checking out branch [yellow]{repo.branch}[/yellow]...")
-            subprocess.run(
-                ["git", "fetch", "origin", repo.branch],
-                cwd=str(repo_path),
-                check=True,
-            )
-            subprocess.run(
-                ["git", "checkout", repo.branch],
-                cwd=str(repo_path),
-                check=True,
-            )
-            subprocess.run(
-                ["git", "pull", "--ff-only"],
-                cwd=str(repo_path),
-                check=True,
-            )
+    if not create_venv:
+        return
 
+    for repo in repos:
+        repo_path = repos_path / repo.name
         venv_path = repo_path / ".venv"
-        if not venv_path.exists():
-            console.print(f"  Creating venv for [cyan]{repo.name}[/cyan]...")
-            uv = _find_uv() or "uv"
-            subprocess.run(
-                [uv, "venv", str(venv_path)],
-                cwd=str(repo_path),
-                env=base_env,
-                check=True,
-            )
+        marker_path = venv_path / ".bipelines-marker"
+        marker = _venv_marker(repo)
+
+        if venv_path.exists():
+            try:
+                stale = marker_path.read_text() != marker
+            except OSError:
+                stale = True
+            if not stale:
+                # Venv was built from the same uv/python/install inputs; an
+                # editable install tracks the checkout, so nothing to redo.
+                continue
+            console.print(f"  Venv for [cyan]{repo.name}[/cyan] is stale — rebuilding...")
+            shutil.rmtree(venv_path)
+
+        console.print(f"  Creating venv for [cyan]{repo.name}[/cyan]...")
+        uv = _find_uv() or "uv"
+        subprocess.run(
+            [uv, "venv", str(venv_path)],
+            cwd=str(repo_path),
+            env=base_env,
+            check=True,
+        )
 
         if repo.install:
             console.print(f"  Installing [cyan]{repo.name}[/cyan]: {repo.install}")
@@ -118,3 +179,5 @@ def setup_local_env(
                 env=repo_venv_env(repo_path),
                 check=True,
             )
+
+        marker_path.write_text(marker)